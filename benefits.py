@@ -19,6 +19,13 @@ month rather than by exact day).
 
 import datetime
 
+import numpy as np
+
+SIM_START_YEAR = 2025
+SIM_END_YEAR = 2100
+N_SIM_YEARS = SIM_END_YEAR - SIM_START_YEAR + 1
+N_SIM_MONTHS = N_SIM_YEARS * 12
+SIM_START_MIDX = SIM_START_YEAR * 12  # month index of January, SIM_START_YEAR
 FRA_MAPPING = [
     (1960, (67, 0)),
     (1959, (66, 10)),
@@ -28,11 +35,28 @@ FRA_MAPPING = [
     (1955, (66, 2)),
     (1943, (66, 0)),
 ]
+# expand the piecewise mapping into a direct per-year table; the mapping
+# plateaus at 1960, so later birth years clamp onto that entry
+_FRA_BY_YEAR = {
+    year: next(fra_age for min_year, fra_age in FRA_MAPPING if year >= min_year)
+    for year in range(1943, 1961)
+}
 PER_MONTH_FIRST_36 = (5 / 9) / 100
 PER_MONTH_AFTER_36 = (5 / 12) / 100
 PER_MONTH_DELAYED = (2 / 3) / 100
 
 
+def _month_index(date: datetime.date) -> int:
+    """Returns a month-granularity index for a date (year * 12 + month - 1)."""
+    return date.year * 12 + date.month - 1
+
+
+def _midx_to_date(midx: int) -> datetime.date:
+    """Returns the first-of-month date for a month index."""
+    year, month0 = divmod(midx, 12)
+    return datetime.date(year, month0 + 1, 1)
+
+
 class Benefit:
     """Model for an individual's Social Security benefit.
 
@@ -52,6 +76,19 @@ class Benefit:
         benefit calculations.
     """
 
+    __slots__ = (
+        "_adjusted_cache",
+        "_fra",
+        "_fra_date",
+        "_fra_midx",
+        "_max_benefit_age_date",
+        "_max_benefit_midx",
+        "_retirement_midx",
+        "birthdate",
+        "full_benefit",
+        "retirement_date",
+    )
+
     def __init__(
         self,
         birthdate: str,
@@ -68,51 +105,99 @@ class Benefit:
         self.birthdate = datetime.date.fromisoformat(birthdate)
         self.full_benefit = full_benefit
         self.retirement_date = retirement_date
-
-    def get_fra(self) -> tuple[int, int]:
-        """Return the FRA as a (years, months) tuple based on birth year.
+        # parse the default retirement date once; everything downstream
+        # works in whole months
+        self._retirement_midx = (
+            _month_index(datetime.date.fromisoformat(retirement_date))
+            if retirement_date is not None
+            else None
+        )
+        # adjusted benefits memoized by retirement month index; options
+        # often share a retirement date for one of the two people
+        self._adjusted_cache: dict[int, float] = {}
+        # lazily-computed caches backing the properties below; slotted
+        # classes cannot use functools.cached_property
+        self._fra: tuple[int, int] | None = None
+        self._fra_date: datetime.date | None = None
+        self._max_benefit_age_date: datetime.date | None = None
+        self._fra_midx: int | None = None
+        self._max_benefit_midx: int | None = None
+
+    @property
+    def fra(self) -> tuple[int, int]:
+        """The FRA as a (years, months) tuple based on birth year.
+
+        Computed once per instance; `birthdate` is fixed in `__init__`,
+        so the cache never needs invalidating.
 
         Raises:
         ------
         ValueError
             If the birth year is outside the supported range (1943+).
         """
-        for min_year, fra_age in FRA_MAPPING:
-            if self.birthdate.year >= min_year:
-                return fra_age
-        raise ValueError(
-            f"Birth year {self.birthdate.year} is outside the supported range (1943+)."
-        )
-
-    def get_fra_date(self) -> datetime.date:
-        """Compute the calendar date corresponding to FRA.
+        if self._fra is None:
+            try:
+                self._fra = _FRA_BY_YEAR[min(self.birthdate.year, 1960)]
+            except KeyError:
+                raise ValueError(
+                    f"Birth year {self.birthdate.year} is outside the supported "
+                    "range (1943+)."
+                ) from None
+        return self._fra
+
+    @property
+    def fra_date(self) -> datetime.date:
+        """The calendar date corresponding to FRA.
 
         The SSA counts ages by month, not by exact day. For this
         project we use the first day of the FRA month as the FRA
         effective date (so comparisons use whole months).
         """
-        fra_years, fra_months = self.get_fra()
-        target_year = self.birthdate.year + fra_years
-        target_month = self.birthdate.month + fra_months
-        if target_month > 12:
-            target_year += (target_month - 1) // 12
-            target_month = (target_month - 1) % 12 + 1
-
-        # Return the first day of the FRA month; this aligns with the
-        # module's month-based calculations.
-        return datetime.date(target_year, target_month, 1)
+        if self._fra_date is None:
+            fra_years, fra_months = self.fra
+            extra_years, month0 = divmod(self.birthdate.month - 1 + fra_months, 12)
+
+            # The first day of the FRA month; this aligns with the
+            # module's month-based calculations.
+            self._fra_date = datetime.date(
+                self.birthdate.year + fra_years + extra_years, month0 + 1, 1
+            )
+        return self._fra_date
 
-    def get_max_benefit_age_date(self) -> datetime.date:
-        """Return the month (as a date on day 1) when the person turns 70.
+    @property
+    def max_benefit_age_date(self) -> datetime.date:
+        """The month (as a date on day 1) when the person turns 70.
 
         Returns:
         -------
         datetime.date
             The first day of the month in which the person reaches age 70.
         """
-        return datetime.date(self.birthdate.year + 70, self.birthdate.month, 1)
-
-    def calculate_adjusted_benefit(self, retirement_date: str | None = None) -> float:
+        if self._max_benefit_age_date is None:
+            self._max_benefit_age_date = datetime.date(
+                self.birthdate.year + 70, self.birthdate.month, 1
+            )
+        return self._max_benefit_age_date
+
+    @property
+    def fra_midx(self) -> int:
+        """Month index of the FRA month."""
+        if self._fra_midx is None:
+            self._fra_midx = _month_index(self.fra_date)
+        return self._fra_midx
+
+    @property
+    def max_benefit_midx(self) -> int:
+        """Month index of the month the person turns 70."""
+        if self._max_benefit_midx is None:
+            self._max_benefit_midx = _month_index(self.max_benefit_age_date)
+        return self._max_benefit_midx
+
+    def calculate_adjusted_benefit(
+        self,
+        retirement_date: str | None = None,
+        month_index: int | None = None,
+    ) -> float:
         """Return the adjusted monthly benefit for a retirement date.
 
         Parameters
@@ -121,6 +206,11 @@ class Benefit:
             ISO date string (YYYY-MM-DD). If omitted, the instance's
             `retirement_date` attribute is used. A `ValueError` is raised
             when no retirement date is available.
+        month_index : int | None
+            Month index of the retirement month (year * 12 + month - 1).
+            A fast path for callers that already work in whole months;
+            takes precedence over `retirement_date` and skips date
+            parsing entirely.
 
         Behavior
         --------
@@ -137,22 +227,23 @@ class Benefit:
         float
             The monthly benefit rounded as a float.
         """
-        if retirement_date is None:
-            retirement_date = self.retirement_date
-        if retirement_date is None:
+        if month_index is None:
+            if retirement_date is None:
+                month_index = self._retirement_midx
+            else:
+                month_index = _month_index(datetime.date.fromisoformat(retirement_date))
+        if month_index is None:
             raise ValueError("'retirement_date' must be provided.")
 
-        retirement_date = datetime.date.fromisoformat(retirement_date)
-        fra_date = self.get_fra_date()
+        cached = self._adjusted_cache.get(month_index)
+        if cached is not None:
+            return cached
 
-        months_diff = (retirement_date.year - fra_date.year) * 12 + (
-            retirement_date.month - fra_date.month
-        )
+        months_diff = month_index - self.fra_midx
 
         if months_diff == 0:
-            return self.full_benefit
-
-        if months_diff < 0:
+            bene = self.full_benefit
+        elif months_diff < 0:
             months_early = abs(months_diff)
             if months_early <= 36:
                 reduction = months_early * PER_MONTH_FIRST_36
@@ -162,16 +253,11 @@ class Benefit:
                 )
             bene = self.full_benefit * (1 - reduction)
         else:
-            max_benefit_date = self.get_max_benefit_age_date()
-            if retirement_date > max_benefit_date:
-                retirement_date: datetime.date = max_benefit_date
-
-            months_delayed = (retirement_date.year - fra_date.year) * 12 + (
-                retirement_date.month - fra_date.month
-            )
+            months_delayed = min(month_index, self.max_benefit_midx) - self.fra_midx
             increase = months_delayed * PER_MONTH_DELAYED
             bene = self.full_benefit * (1 + increase)
 
+        self._adjusted_cache[month_index] = bene
         return bene
 
     def __repr__(self) -> str:
@@ -189,6 +275,8 @@ class Couple:
     adjusted benefit.
     """
 
+    __slots__ = ("_spousal1", "_spousal2", "person1", "person2")
+
     def __init__(self, person1: Benefit, person2: Benefit) -> None:
         """Initializes the Couple object.
 
@@ -198,11 +286,17 @@ class Couple:
         """
         self.person1 = person1
         self.person2 = person2
+        # spousal top-ups depend only on the fixed full benefits, so
+        # compute them once here
+        self._spousal1 = max(0, (person2.full_benefit / 2) - person1.full_benefit)
+        self._spousal2 = max(0, (person1.full_benefit / 2) - person2.full_benefit)
 
     def calculate_joint_benefits(
         self,
         retirement_date1: str | None = None,
         retirement_date2: str | None = None,
+        month_index1: int | None = None,
+        month_index2: int | None = None,
     ) -> dict[str, float]:
         """Compute adjusted benefits for both people and the couple total.
 
@@ -211,29 +305,44 @@ class Couple:
         retirement_date1, retirement_date2 : str | None
             ISO date strings for each person's retirement date. If omitted,
             the `Benefit` instance's `retirement_date` is used.
+        month_index1, month_index2 : int | None
+            Month indices of the retirement months; the parse-free fast
+            path, taking precedence over the date strings.
 
         Returns:
         -------
         dict[str, float]
             Keys: `person1_benefit`, `person2_benefit`, `total_joint_benefit`.
         """
-        benefit1 = self.person1.calculate_adjusted_benefit(retirement_date1)
-        benefit2 = self.person2.calculate_adjusted_benefit(retirement_date2)
-
-        spousal_benefit1 = max(
-            0, (self.person2.full_benefit / 2) - self.person1.full_benefit
+        benefit1 = self.person1.calculate_adjusted_benefit(
+            retirement_date1, month_index1
         )
-        spousal_benefit2 = max(
-            0, (self.person1.full_benefit / 2) - self.person2.full_benefit
+        benefit2 = self.person2.calculate_adjusted_benefit(
+            retirement_date2, month_index2
         )
 
-        total_benefit1 = benefit1 + spousal_benefit1
-        total_benefit2 = benefit2 + spousal_benefit2
+        total_benefit1 = benefit1 + self._spousal1
+        total_benefit2 = benefit2 + self._spousal2
+
+        # raw floats; rounding is left to the presentation layer (see
+        # `formatted_benefits`) so downstream math compounds exact values
+        return {
+            "person1_benefit": total_benefit1,
+            "person2_benefit": total_benefit2,
+            "total_joint_benefit": total_benefit1 + total_benefit2,
+        }
 
+    def formatted_benefits(
+        self,
+        retirement_date1: str | None = None,
+        retirement_date2: str | None = None,
+    ) -> dict[str, float]:
+        """Joint benefits rounded to cents, for display purposes."""
         return {
-            "person1_benefit": round(total_benefit1, 2),
-            "person2_benefit": round(total_benefit2, 2),
-            "total_joint_benefit": round(total_benefit1 + total_benefit2, 2),
+            key: round(value, 2)
+            for key, value in self.calculate_joint_benefits(
+                retirement_date1, retirement_date2
+            ).items()
         }
 
     def __repr__(self) -> str:
@@ -248,6 +357,20 @@ class Option:
     in the project.
     """
 
+    __slots__ = (
+        "annual_payments",
+        "balance",
+        "breakeven_date",
+        "couple",
+        "eoy_balances",
+        "monthly_benefit",
+        "monthly_pmt",
+        "retirement_date1",
+        "retirement_date2",
+        "retirement_midx1",
+        "retirement_midx2",
+    )
+
     def __init__(
         self,
         couple: Couple,
@@ -267,17 +390,43 @@ class Option:
             else couple.person2.retirement_date
         )
 
+        self.retirement_midx1 = (
+            _month_index(self.retirement_date1)
+            if retirement_date1 is not None
+            else couple.person1._retirement_midx
+        )
+        self.retirement_midx2 = (
+            _month_index(self.retirement_date2)
+            if retirement_date2 is not None
+            else couple.person2._retirement_midx
+        )
+
         self.monthly_benefit = couple.calculate_joint_benefits(
-            retirement_date1=retirement_date1,
-            retirement_date2=retirement_date2,
+            month_index1=self.retirement_midx1,
+            month_index2=self.retirement_midx2,
         ).get("total_joint_benefit")
 
-        # bookkeeping fields
+        # gross payment per simulation month: person1's benefit alone
+        # until person2 retires, the joint benefit from then on
+        only_benefit = couple.person1.calculate_adjusted_benefit(
+            month_index=self.retirement_midx1
+        )
+        self.monthly_pmt = np.full(N_SIM_MONTHS, only_benefit)
+        self.monthly_pmt[self.retirement_midx2 - SIM_START_MIDX :] = (
+            self.monthly_benefit
+        )
+
+        # bookkeeping fields, per-year values indexed by year - SIM_START_YEAR
         self.balance = 0.0
-        self.annual_payments = {}
-        self.eoy_balances = {}
+        self.annual_payments = np.zeros(N_SIM_YEARS)
+        self.eoy_balances = np.zeros(N_SIM_YEARS)
         self.breakeven_date = None
 
+    @staticmethod
+    def as_dict(values: np.ndarray) -> dict[int, float]:
+        """Returns a per-year bookkeeping array as a dict keyed by year."""
+        return {SIM_START_YEAR + i: float(v) for i, v in enumerate(values)}
+
     def __repr__(self) -> str:
         return (
             f"Option(couple={self.couple}), "
@@ -292,6 +441,8 @@ class Breakeven:
     Holds a baseline `Option` and a list of alternative `Option` instances.
     """
 
+    __slots__ = ("alternatives", "baseline", "options")
+
     def __init__(self, baseline: Option, alternatives: list[Option]) -> None:
         self.baseline = baseline
         self.alternatives = alternatives
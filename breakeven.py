@@ -8,22 +8,21 @@ benefit from dad overtakes the baseline scenario of dad retiring earlier.
 """
 
 import datetime
-
-from benefits import Benefit, Breakeven, Couple, Option
-
-
-def next_month(current_date: datetime.date) -> datetime.date:
-    """Calculates the 1st day of the next month."""
-    # Check for year rollover
-    if current_date.month == 12:
-        next_month = 1
-        next_year = current_date.year + 1
-    else:
-        next_month = current_date.month + 1
-        next_year = current_date.year
-
-    return datetime.date(next_year, next_month, 1)
-
+from collections.abc import Callable
+
+import numpy as np
+
+from benefits import (
+    N_SIM_MONTHS,
+    N_SIM_YEARS,
+    SIM_START_MIDX,
+    Benefit,
+    Breakeven,
+    Couple,
+    Option,
+    _midx_to_date,
+    _month_index,
+)
 
 mom = Benefit(
     birthdate="1960-01-01",
@@ -32,11 +31,7 @@ mom = Benefit(
 )
 dad = Benefit(birthdate="1960-06-01", full_benefit=3500.00)
 
-only_m = mom.calculate_adjusted_benefit()
 dad.calculate_adjusted_benefit(retirement_date="2025-12-01")
-dad.get_fra()
-dad.get_fra_date()
-dad.get_max_benefit_age_date()
 
 couple = Couple(mom, dad)
 
@@ -46,55 +41,138 @@ option_c = Option(couple, retirement_date2="2027-06-01")
 
 options = Breakeven(baseline=option_a, alternatives=[option_b, option_c])
 
-loop_date = datetime.date(2025, 12, 1)
+start_date = datetime.date(2025, 12, 1)
 # replace 0.0 with APR of expected return on investment
 # it will be compounded monthly
 growth_factor = 1 + 0.0 / 12
 # portion of gains taxed as interest vs. capital gains
 gain_pct_interest = 1.0
-while True:
-    year = loop_date.year  # year - 1 is the tax year
-    month = loop_date.month
-    tax_rate_federal = 0.24 if year - 1 <= 2027 else 0.22  # vary pre/post retirement
+
+# Integer month index for the whole simulation, padded back to January of
+# the start year so per-year bookkeeping reshapes cleanly to (years, 12).
+# Dates are only materialized again when reporting results.
+midxs = np.arange(SIM_START_MIDX, SIM_START_MIDX + N_SIM_MONTHS)
+years = midxs // 12
+start_midx = _month_index(start_date)
+start_idx = start_midx - SIM_START_MIDX
+
+
+def make_simulator(
+    breakeven: Breakeven,
+    growth_factor: float,
+    gain_pct_interest: float,
+) -> Callable[[], np.ndarray]:
+    """Builds a simulator specialized to a fixed set of options.
+
+    Per-option constants -- the gross payment tables and the growth power
+    vectors -- are bound into the returned closure once, so calling the
+    simulator only runs the per-year recurrence. Payments, tax rates and
+    within-year compounding are evaluated as NumPy arrays over the shared
+    month index; only the April tax settlement, which feeds back through
+    prior end-of-year balances, steps year by year.
+    """
+    # powers of the monthly growth factor; entry t is g**t
+    g = growth_factor
+    pw = g ** np.arange(N_SIM_MONTHS)
+    g12 = g**12
+    g8 = g**8  # April's tax compounded through December
+
+    # tax schedules are option-independent, so build them once up front
+    tax_rate_federal = np.where(years - 1 <= 2027, 0.24, 0.22)  # pre/post retirement
     tax_rate_state = 0.0
     tax_rate_county = 0.0
     tax_rate_ss = tax_rate_federal * 0.85  # up to 85% of SS benefits are taxable
     tax_rate_capital_gains = 0.0  # assuming no investment sales
     tax_rate_interest = tax_rate_federal + tax_rate_state + tax_rate_county
+    # effective rate applied to each April's taxable gain, per year
+    april_tax_rate = (
+        gain_pct_interest * tax_rate_interest[3::12]
+        + (1 - gain_pct_interest) * tax_rate_capital_gains
+    )
 
-    for option in options.options:
-        pmt = option.monthly_benefit if loop_date >= option.retirement_date2 else only_m
-        pmt *= 1 - tax_rate_ss  # after tax
-        if option.annual_payments.get(year) is None:
-            option.annual_payments[year] = 0.0
-        option.annual_payments[year] += pmt
-        option.balance += pmt
-        option.balance *= growth_factor
-        if month == 4:
-            # In April, pay taxes on last year's gains
+    # after-tax payments; nothing accrues before the start date
+    pmts = [
+        np.where(midxs >= start_midx, option.monthly_pmt, 0.0) * (1 - tax_rate_ss)
+        for option in breakeven.options
+    ]
+
+    def simulate_option(option: Option, pmt: np.ndarray) -> np.ndarray:
+        pmt_by_year = pmt.reshape(N_SIM_YEARS, 12)
+        annual_payments = option.annual_payments
+        annual_payments[:] = pmt_by_year.sum(axis=1)
+        eoy_balances = option.eoy_balances
+
+        if g == 1.0:
+            # without growth there are never taxable gains, so the whole
+            # recurrence degenerates to a running total of payments
+            balances = np.cumsum(pmt)
+            eoy_balances[:] = balances[11::12]
+            return balances
+
+        # Unrolling b[t] = (b[t-1] + pmt[t]) * g over the whole horizon
+        # gives b[t] = sum over k <= t of pmt[k] * g**(t-k+1) -- the
+        # lfilter form of the recurrence -- which is one growth-weighted
+        # cumulative sum.
+        base = g * pw * np.cumsum(pmt / pw)
+
+        # Each April's settlement feeds back through earlier end-of-year
+        # balances, so resolve the per-year tax amounts with a short
+        # scalar recurrence first...
+        taxes = np.empty(N_SIM_YEARS)
+        carry = 0.0  # taxes already paid, compounded to December
+        for y in range(N_SIM_YEARS):
+            # pay taxes on last year's gains
             gain = (
-                option.eoy_balances.get(year - 1, 0)
-                - option.eoy_balances.get(year - 2, 0)
-                - option.annual_payments.get(year - 1, 0)
-            )
-            option.balance -= gain * (
-                gain_pct_interest * tax_rate_interest
-                + (1 - gain_pct_interest) * tax_rate_capital_gains
+                (eoy_balances[y - 1] if y >= 1 else 0.0)
+                - (eoy_balances[y - 2] if y >= 2 else 0.0)
+                - (annual_payments[y - 1] if y >= 1 else 0.0)
             )
-        if month == 12:
-            option.eoy_balances[year] = option.balance
-
-        if option == options.baseline:
-            continue
-        if option.breakeven_date is None and option.balance >= options.baseline.balance:
-            option.breakeven_date = loop_date
-
-    if all(option.breakeven_date is not None for option in options.alternatives):
-        break
-    if loop_date.year > 2100:
-        print("Loop exceeded reasonable date range.")
-        break
-    loop_date = next_month(loop_date)
+            taxes[y] = gain * april_tax_rate[y]
+            carry = carry * g12 + taxes[y] * g8
+            eoy_balances[y] = base[y * 12 + 11] - carry
+
+        # ...then compound every April deduction across the month axis in
+        # one sparse cumulative pass
+        deductions = np.zeros(N_SIM_MONTHS)
+        deductions[3::12] = taxes / pw[3::12]
+        return base - pw * np.cumsum(deductions)
+
+    def run() -> np.ndarray:
+        return np.stack(
+            [
+                simulate_option(option, pmt)
+                for option, pmt in zip(breakeven.options, pmts, strict=True)
+            ]
+        )
+
+    return run
+
+
+simulate = make_simulator(options, growth_factor, gain_pct_interest)
+trajectories = simulate()
+
+# row 0 is the baseline; compare every alternative against it at once
+crossed = trajectories[1:, start_idx:] >= trajectories[0, start_idx:]
+has_crossed = crossed.any(axis=1)
+crossover = np.argmax(crossed, axis=1)
+
+breakeven_idxs = []
+for option, hit, offset in zip(
+    options.alternatives, has_crossed, crossover, strict=True
+):
+    if hit:
+        idx = start_idx + int(offset)
+        option.breakeven_date = _midx_to_date(SIM_START_MIDX + idx)
+        breakeven_idxs.append(idx)
+
+if len(breakeven_idxs) < len(options.alternatives):
+    print("Simulation exceeded reasonable date range.")
+
+# Balances are reported as of the month the last alternative breaks even,
+# matching the point where the month-by-month scan used to stop.
+end_idx = max(breakeven_idxs, default=N_SIM_MONTHS - 1)
+for option, balances in zip(options.options, trajectories, strict=True):
+    option.balance = float(balances[end_idx])
 
 for option in options.alternatives:
     print(
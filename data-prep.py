@@ -1,21 +1,34 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import polars as pl
 
-for i in range(1, 19):
-    df = pl.read_excel(f"data/Table{i:02}.xlsx", has_header=False)
+
+def process(i: int) -> None:
+    # project to the two used columns at the reader and pin their dtypes,
+    # so the other columns are never parsed and inference is skipped; the
+    # projected columns come back renamed column_1/column_2
+    df = pl.read_excel(
+        f"data/Table{i:02}.xlsx",
+        has_header=False,
+        columns=[0, 2],
+        schema_overrides={"column_1": pl.Utf8, "column_2": pl.Utf8},
+    )
     tbl_nm = df.slice(0, 1)["column_1"].item().strip()
     df = (
-        df.select("column_1", "column_3")
+        df.lazy()
         .slice(3)
-        .rename({"column_1": "Age", "column_3": "NumSurvivors"})
+        .rename({"column_1": "Age", "column_2": "NumSurvivors"})
         .filter(pl.col("NumSurvivors").is_not_null())
-        .with_columns(pl.col("Age").str.split("–").list.first())  # noqa: RUF001
-        .with_columns(
-            pl.when(pl.col("Age").str.starts_with("100"))
-            .then(pl.lit("100"))
-            .otherwise(pl.col("Age"))
-            .cast(pl.Int8)
-            .alias("Age"),
-        )
+        # one regex pass covers both the "65-66" age ranges and the
+        # "100 and over" special case
+        .with_columns(pl.col("Age").str.extract(r"^(\d+)").cast(pl.Int8))
+        .collect()
     )
 
     df.write_csv(f"data/{tbl_nm}.csv")
+
+
+# the 18 tables are independent, and the Excel parsing releases the GIL,
+# so fan the files out across a small thread pool
+with ThreadPoolExecutor(max_workers=8) as executor:
+    list(executor.map(process, range(1, 19)))